@@ -1,12 +1,19 @@
+import importlib
 import logging
 
-from quorum_fullnode_py.client import FullNode, HttpRequest
-
 __version__ = "1.3.2"
 __author__ = "liujuanjuan1984"
+__all__ = ["FullNode", "HttpRequest"]  # pylint: disable=undefined-all-variable
 
 # Set default logging handler to avoid "No handler found" warnings.
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-logger.info("Version %s", __version__)
+
+def __getattr__(name):
+    """import the client classes on first access,
+    so that importing the package does not load requests"""
+    if name in __all__:
+        client = importlib.import_module("quorum_fullnode_py.client")
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,22 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+
+    def dumps(obj) -> bytes:
+        """serialize obj to json bytes"""
+        return orjson.dumps(obj)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        """serialize obj to json bytes"""
+        return json.dumps(obj).encode("utf-8")
@@ -1,6 +1,18 @@
+import importlib
 import logging
 
 from quorum_fullnode_py.api.base import BaseAPI
 from quorum_fullnode_py.api.fullnode import FullNodeAPI
 
 logger = logging.getLogger(__name__)
+
+
+def __getattr__(name):
+    """import AsyncFullNodeAPI on first access,
+    so that the sync api does not load asyncio"""
+    if name == "AsyncFullNodeAPI":
+        module = importlib.import_module(
+            "quorum_fullnode_py.api.async_fullnode"
+        )
+        return module.AsyncFullNodeAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
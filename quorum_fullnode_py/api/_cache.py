@@ -0,0 +1,47 @@
+import threading
+import time
+
+
+class TTLCache:
+    """thread-safe cache of api responses with per-key expiry"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """return the cached value, or None if missing or expired"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value, ttl: float = None):
+        """cache value for ttl seconds, or forever when ttl is None"""
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (expires_at, value)
+
+    def delete(self, key: str):
+        """drop the key if cached"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, prefix: str = None):
+        """drop the keys startswith prefix,
+        or all the expiring keys when prefix is None"""
+        with self._lock:
+            if prefix is None:
+                keys = [k for k, v in self._data.items() if v[0] is not None]
+            else:
+                keys = [k for k in self._data if k.startswith(prefix)]
+            for key in keys:
+                del self._data[key]
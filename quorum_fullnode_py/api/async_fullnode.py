@@ -0,0 +1,50 @@
+import asyncio
+import logging
+from functools import partial, wraps
+
+from quorum_fullnode_py.api.fullnode import FullNodeAPI
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFullNodeAPI:
+    """awaitable view of a FullNodeAPI for asyncio callers
+    each method call runs the sync api in the default executor,
+    so many group operations can be awaited with asyncio.gather
+    over the same pooled http session
+    properties such as groups_id may send a request, so reading them
+    also returns an awaitable; plain attributes are returned as is,
+    private names are not exposed
+
+    async_api = AsyncFullNodeAPI(client.api)
+    infos = await asyncio.gather(*(async_api.group_info(i) for i in ids))
+    groups_id = await async_api.groups_id
+    """
+
+    __slots__ = ("api",)
+
+    def __init__(self, api: FullNodeAPI):
+        self.api = api
+
+    @staticmethod
+    async def _run(func):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func)
+
+    def __getattr__(self, name: str):
+        # private names would come back as blocking sync callables;
+        # an unset api slot, e.g. on a copy, would recurse
+        if name == "api" or name.startswith("_"):
+            raise AttributeError(name)
+        api = self.api
+        if isinstance(getattr(type(api), name, None), property):
+            return self._run(partial(getattr, api, name))
+        attr = getattr(api, name)
+        if not callable(attr):
+            return attr
+
+        @wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._run(partial(attr, *args, **kwargs))
+
+        return method
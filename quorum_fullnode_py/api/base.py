@@ -1,11 +1,51 @@
-import json
 import logging
-from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from typing import TYPE_CHECKING
+from urllib.parse import quote_plus
 
-from quorum_fullnode_py.client._http import HttpRequest
+from quorum_fullnode_py.api._cache import TTLCache
+
+if TYPE_CHECKING:
+    from quorum_fullnode_py.client._http import HttpRequest
 
 logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 16
+# caching is opt-in: the node applies writes asynchronously,
+# so a cached GET may hide a change for up to cache_ttl seconds
+CACHE_TTL = 0
+# responses of these endpoints change too often to be cached
+_NO_CACHE_SUFFIXES = ("/pubqueue", "/consensus/proof/current", "/content")
+
+
+# exact type lookup, so bool is never encoded as int
+_QS_ENCODERS = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    str: quote_plus,
+}
+
+
+def _qs_value(value) -> str:
+    """format a query string value, bool as lowercase literal"""
+    encode = _QS_ENCODERS.get(type(value))
+    return encode(value) if encode else quote_plus(str(value))
+
+
+def _build_content_qs(params: dict) -> str:
+    """build the query string of the content api params
+    the keys are known names and need no quoting"""
+    parts = []
+    for k, v in params.items():
+        if isinstance(v, (list, tuple)):
+            # as urlencode with doseq, items are quoted as str
+            parts.extend(f"{k}={quote_plus(str(i))}" for i in v)
+        else:
+            parts.append(f"{k}={_qs_value(v)}")
+    return "&".join(parts)
+
 
 class BaseAPI:
     """
@@ -13,18 +53,86 @@ class BaseAPI:
     good for quorum chain testing
     """
 
-    def __init__(self, http: HttpRequest, group_id: str):
+    __slots__ = ("_http", "group_id", "cache_ttl", "_cache")
+
+    def __init__(
+        self, http: "HttpRequest", group_id: str, cache_ttl: float = CACHE_TTL
+    ):
         self._http = http
         self.group_id = group_id
+        self.cache_ttl = cache_ttl
+        self._cache = TTLCache()
+
+    def _get_cache_ttl(self, endpoint: str, resp):
+        """return seconds to cache the GET response,
+        None to cache it forever, 0 to skip caching"""
+        if not self.cache_ttl or resp is None:
+            return 0
+        if isinstance(resp, dict) and "error" in resp:
+            return 0
+        if endpoint.split("?")[0].endswith(_NO_CACHE_SUFFIXES):
+            return 0
+        # blocks and trxs are immutable once they are on chain
+        if endpoint.startswith("/api/v1/block/"):
+            return None if isinstance(resp, dict) and resp.get("BlockId") else 0
+        if endpoint.startswith("/api/v1/trx/"):
+            return None if isinstance(resp, dict) and resp.get("TrxId") else 0
+        return self.cache_ttl
 
     def _get(self, endpoint: str, payload: dict = None):
-        return self._http.get(endpoint, payload)
+        if payload is not None:
+            return self._http.get(endpoint, payload)
+        resp = self._get_shared(endpoint)
+        # callers may mutate the response, so never hand out the cached one
+        if resp is not None and self._cache.get(endpoint) is resp:
+            return deepcopy(resp)
+        return resp
+
+    def _get_shared(self, endpoint: str):
+        """return the GET response, which may be the cached object itself,
+        so it must be treated as read-only"""
+        resp = self._cache.get(endpoint)
+        if resp is not None:
+            return resp
+        resp = self._http.get(endpoint)
+        ttl = self._get_cache_ttl(endpoint, resp)
+        if ttl != 0:
+            self._cache.set(endpoint, resp, ttl)
+        return resp
 
     def _post(self, endpoint: str, payload: dict = None):
-        return self._http.post(endpoint, payload)
+        resp = self._http.post(endpoint, payload)
+        self.invalidate()
+        return resp
 
     def _delete(self, endpoint: str, payload: dict = None):
-        return self._http.delete(endpoint, payload)
+        resp = self._http.delete(endpoint, payload)
+        self.invalidate()
+        return resp
+
+    def invalidate(self, prefix: str = None):
+        """drop cached GET responses of endpoints startswith prefix,
+        or all the expiring ones when prefix is None"""
+        self._cache.invalidate(prefix)
+
+    def _gather(self, *calls):
+        """run independent calls concurrently, return results in order"""
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        workers = min(len(calls), MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def batch(self, calls: list) -> list:
+        """send independent requests concurrently over the pooled session
+        calls: list of (method, endpoint) or (method, endpoint, payload)
+        return the responses in the same order as calls
+        """
+        methods = {"get": self._get, "post": self._post, "delete": self._delete}
+        return self._gather(
+            *(partial(methods[call[0].lower()], *call[1:]) for call in calls)
+        )
 
     def _get_node(self):
         """get node info"""
@@ -39,7 +147,7 @@ class BaseAPI:
         return self._get(f"/api/v1/group/{group_id}")
 
     def _get_seed(self, group_id: str = None, include_chain_url: bool = False):
-        include_chain_url = json.dumps(include_chain_url)
+        include_chain_url = _qs_value(include_chain_url)
         return self._get(
             f"/api/v1/group/{group_id}/seed?include_chain_url={include_chain_url}"
         )
@@ -109,11 +217,7 @@ class BaseAPI:
     def _get_content(self, group_id: str = None, query_params: dict = None):
         endpoint = f"/app/api/v1/group/{group_id}/content"
         if query_params:
-            for k, v in query_params.items():
-                if isinstance(v, bool):
-                    query_params[k] = json.dumps(v)
-            query_string = urlencode(query_params, doseq=True)
-            endpoint = f"{endpoint}?{query_string}"
+            endpoint = f"{endpoint}?{_build_content_qs(query_params)}"
         return self._get(endpoint)
 
     def _get_appconfig_keylist(self, group_id: str = None):
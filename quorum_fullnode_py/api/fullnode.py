@@ -1,11 +1,17 @@
 import base64
 import datetime
-import json
 import logging
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING
 
-from quorum_fullnode_py.api.base import BaseAPI
+from quorum_fullnode_py._json import dumps, loads
+from quorum_fullnode_py.api._cache import TTLCache
+from quorum_fullnode_py.api.base import CACHE_TTL, BaseAPI
 from quorum_fullnode_py.exceptions import ParamValueError, RumChainException
 
+if TYPE_CHECKING:
+    from quorum_fullnode_py.client._http import HttpRequest
+
 logger = logging.getLogger(__name__)
 
 TRX_TYPES = [
@@ -17,32 +23,154 @@ TRX_TYPES = [
     "BLOCK_PRODUCED",
     "ASK_PEERID",
 ]
-
-
-def _get_isoday(timedelta_days=0):
-    """return iso day format string 2027-04-28T08:10:36.675204+00:00"""
-    now = datetime.datetime.now(datetime.timezone.utc)
-    day = now + datetime.timedelta(days=timedelta_days)
-    iso = day.isoformat(timespec="seconds")
-    return iso
-
-
+_TRX_TYPES_SET = frozenset(TRX_TYPES)
+# common spellings hit the tables directly, without lower()
+_MODE_MAP = {
+    "dny": "dny",
+    "deny": "dny",
+    "alw": "alw",
+    "allow": "alw",
+    "DNY": "dny",
+    "DENY": "dny",
+    "ALW": "alw",
+    "ALLOW": "alw",
+}
+_ACTION_MAP = {
+    "add": "add",
+    "remove": "remove",
+    "ADD": "add",
+    "REMOVE": "remove",
+}
+_ROLES = frozenset(("node", "chain"))
+# payload key, key in the consensus req, default value
+_CONSENSUS_FIELDS = (
+    ("start_from_epoch", "StartFromEpoch", 1),
+    ("trx_epoch_tick", "TrxEpochTickLenInMs", 500),
+    ("agreement_tick_Length", "AgreementTickLenInMs", 1000),
+    ("agreement_tick_count", "AgreementTickCount", 10),
+    ("producer_pubkey", "ProducerPubkeyList", []),
+)
+# default memo of the announce payloads by (type, action)
+_ANNOUNCE_MEMOS = {
+    ("producer", "add"): "announce self as producer",
+    ("producer", "remove"): "announce self as producer to remove",
+    ("user", "add"): "announce self as user",
+}
+_UTC = datetime.timezone.utc
+_FIVE_YEARS = datetime.timedelta(days=5 * 365)
+PUBKEY_ADDR_CACHE_SIZE = 4096
+APPROVED_USERS_CACHE_SIZE = 512
+
+
+def _get_isoday(delta: datetime.timedelta = None):
+    """return iso day format string 2027-04-28T08:10:36+00:00"""
+    day = datetime.datetime.now(_UTC)
+    if delta:
+        day += delta
+    return day.isoformat(timespec="seconds")
+
+
+@lru_cache(maxsize=32)
 def _check_trx_type(trx_type: str):
+    if trx_type in _TRX_TYPES_SET:
+        return trx_type
     trx_type = trx_type.upper()
-    if trx_type not in TRX_TYPES:
+    if trx_type not in _TRX_TYPES_SET:
         raise ParamValueError(f"{trx_type} must be one of {TRX_TYPES}")
     return trx_type
 
 
+@lru_cache(maxsize=32)
 def _check_trx_mode(mode: str):
-    if mode.lower() in ["dny", "deny"]:
-        return "dny"
-    if mode.lower() in ["alw", "allow"]:
-        return "alw"
-    raise ParamValueError(f"{mode} mode must be one of ['deny','allow']")
+    _mode = _MODE_MAP.get(mode) or _MODE_MAP.get(mode.lower())
+    if _mode is None:
+        raise ParamValueError(f"{mode} mode must be one of ['deny','allow']")
+    return _mode
+
+
+def _check_role(role: str = None):
+    role = role or "node"
+    if role not in _ROLES:
+        raise ParamValueError("role must be one of ['node','chain']")
+    return role
+
+
+def _check_action(action: str = None):
+    action = action or "add"
+    _action = _ACTION_MAP.get(action) or _ACTION_MAP.get(action.lower())
+    if _action is None:
+        raise ParamValueError("action must be add or remove")
+    return _action
+
+
+def _decode_trxs(trxs: list):
+    """yield copies of trxs with the base64 encoded Data decoded
+    the response objects are shared with the http cache, so never mutated
+    """
+    for trx in trxs:
+        # private group will return trx without Data
+        data = trx.get("Data")
+        if data:
+            try:
+                trx = {**trx, "Data": loads(base64.b64decode(data))}
+            except (TypeError, ValueError) as err:
+                logger.warning(
+                    "decode trx data error: %s trx_id=%s", err, trx.get("TrxId")
+                )
+        yield trx
+
+
+def _chainconfig_payload(group_id: str, _type: str, config: dict, memo: str):
+    """build the chainconfig payload, config is embedded as json string"""
+    return {
+        "group_id": group_id,
+        "type": _type,
+        "config": dumps(config).decode(),
+        "Memo": memo,
+    }
+
+
+def _merge_consensus(req: dict, values: tuple):
+    """merge the new values into the existing consensus req in one pass
+    return None if nothing changed"""
+    payload = {}
+    changed = False
+    for (key, req_key, default), value in zip(_CONSENSUS_FIELDS, values):
+        exist = req.get(req_key) or default
+        if value and value != exist:
+            changed = True
+            payload[key] = value
+        else:
+            payload[key] = exist
+    return payload if changed else None
+
+
+def _producers_from(consensus: dict) -> list:
+    """return the producers pubkey list of a fetched consensus"""
+    return [bp["ProducerPubkey"] for bp in consensus.get("producers") or []]
 
 
 class FullNodeAPI(BaseAPI):
+    __slots__ = (
+        "_groups_cache",
+        "_network_cache",
+        "_pubkey_addrs",
+        "_approved_users",
+    )
+
+    def __init__(
+        self, http: "HttpRequest", group_id: str, cache_ttl: float = CACHE_TTL
+    ):
+        super().__init__(http, group_id, cache_ttl)
+        # (groups response, dict of group_id to its record, set of group_id)
+        self._groups_cache = None
+        # (network response, dict of group_id to its peers)
+        self._network_cache = None
+        # pubkey to address is a pure mapping, so convert each pubkey once
+        self._pubkey_addrs = TTLCache(PUBKEY_ADDR_CACHE_SIZE)
+        # "group_id/pubkey" of users already approved, to skip the check
+        self._approved_users = TTLCache(APPROVED_USERS_CACHE_SIZE)
+
     def _check_group_id_as_required(self, group_id: str = None):
         group_id = group_id or self.group_id
         if not group_id:
@@ -51,13 +179,16 @@ class FullNodeAPI(BaseAPI):
 
     def _check_group_joined_as_required(self, group_id: str = None):
         group_id = self._check_group_id_as_required(group_id)
-        if group_id not in self.groups_id:
+        if group_id not in self.groups_id_set:
             raise RumChainException(f"You are not in this group: <{group_id}>.")
         return group_id
 
     def _check_group_owner_as_required(self, group_id: str = None):
-        group_id = self._check_group_joined_as_required(group_id)
-        info = self.group_info(group_id)
+        group_id = self._check_group_id_as_required(group_id)
+        # one lookup of the cached groups index checks joined and owner
+        info = self._groups_index().get(group_id)
+        if info is None:
+            raise RumChainException(f"You are not in this group: <{group_id}>.")
         if info.get("user_pubkey", "user") != info.get("owner_pubkey", "owner"):
             raise RumChainException(
                 f"You are not the owner of this group: <{group_id}>."
@@ -91,12 +222,38 @@ class FullNodeAPI(BaseAPI):
     @property
     def groups_id(self) -> list:
         """return list of group_id which node has joined"""
-        return [i["group_id"] for i in self.groups()]
+        return list(self._groups_index())
+
+    @property
+    def groups_id_set(self) -> frozenset:
+        """return frozenset of group_id which node has joined"""
+        return self._groups_cached()[2]
+
+    def _groups_index(self) -> dict:
+        """return dict of group_id to its group record which node has joined"""
+        return self._groups_cached()[1]
+
+    def _groups_cached(self) -> tuple:
+        """return (groups response, index, group_id set),
+        rebuilt only when the groups response is refetched"""
+        data = self._get_shared("/api/v1/groups") or {}
+        cached = self._groups_cache
+        if cached is None or cached[0] is not data:
+            index = {i["group_id"]: i for i in data.get("groups") or []}
+            cached = self._groups_cache = (data, index, frozenset(index))
+        return cached
 
     def pubkeytoaddr(self, pubkey: str):
         """convert pubkey to address"""
+        addr = self._pubkey_addrs.get(pubkey)
+        if addr is not None:
+            return addr
         resp = super()._pubkeytoaddr({"encoded_pubkey": pubkey})
-        return resp.get("addr", resp)
+        if "addr" not in resp:
+            return resp
+        addr = resp["addr"]
+        self._pubkey_addrs.set(pubkey, addr)
+        return addr
 
     def create_token(
         self,
@@ -110,9 +267,7 @@ class FullNodeAPI(BaseAPI):
         expires_at: ISO time 2027-04-28T08:10:36.675204+00:00
         """
 
-        role = role or "node"
-        if role not in ("node", "chain"):
-            raise ParamValueError("role must be one of ['node','chain']")
+        role = _check_role(role)
         if role == "chain":
             group_id = None
             name = name or "allow-chain"
@@ -120,7 +275,7 @@ class FullNodeAPI(BaseAPI):
             group_id = self._check_group_id_as_required(group_id)
             name = name or f"allow-{group_id}"
 
-        expires_at = expires_at or _get_isoday(5 * 365)
+        expires_at = expires_at or _get_isoday(_FIVE_YEARS)
         payload = {
             "name": name,
             "role": role,
@@ -148,9 +303,7 @@ class FullNodeAPI(BaseAPI):
         to revoke a usable token and make it unusable,
         then add it to the "revoke list" in the config file.
         """
-        role = role or "node"
-        if role not in ("node", "chain"):
-            raise ParamValueError("role must be one of ['node','chain']")
+        role = _check_role(role)
         if role == "chain":
             group_id = None
         else:
@@ -166,9 +319,7 @@ class FullNodeAPI(BaseAPI):
         self, token: str = None, role: str = None, group_id: str = None
     ):
         """to delete token from config file"""
-        role = role or "node"
-        if role not in ("node", "chain"):
-            raise ParamValueError("role must be one of ['node','chain']")
+        role = _check_role(role)
         if role == "chain":
             group_id = None
         else:
@@ -183,19 +334,46 @@ class FullNodeAPI(BaseAPI):
     def group_network(self, group_id: str = None):
         """return the peers connented to the group"""
         group_id = self._check_group_id_as_required(group_id)
-        rlt = []
-        groups = super()._get_network().get("groups", [])
-        for i in groups:
-            if i.get("GroupId") == group_id:
-                rlt = i.get("Peers", [])
-                break
-        return rlt
+        return self._groups_peers().get(group_id, [])
+
+    def _groups_peers(self) -> dict:
+        """return dict of group_id to its peers,
+        rebuilt only when the network response is refetched"""
+        data = self._get_shared("/api/v1/network") or {}
+        cached = self._network_cache
+        if cached is None or cached[0] is not data:
+            peers = {
+                i.get("GroupId"): i.get("Peers") or []
+                for i in data.get("groups") or []
+            }
+            cached = self._network_cache = (data, peers)
+        return cached[1]
 
     def group_info(self, group_id: str = None) -> dict:
         """get the group info"""
         group_id = self._check_group_joined_as_required(group_id)
         return super()._get_group(group_id)
 
+    def snapshot(self, group_id: str = None) -> dict:
+        """get the group info, consensus, appconfig keylist, allow/deny list,
+        announced producers and users, and pub queue of a group
+        with concurrent requests
+        """
+        group_id = self._check_group_joined_as_required(group_id)
+        getters = {
+            "group": super()._get_group,
+            "consensus": super()._get_consensus,
+            "consensus_last": super()._get_consensus_last,
+            "keylist": super()._get_appconfig_keylist,
+            "allow_list": super()._get_allowlist,
+            "deny_list": super()._get_denylist,
+            "announced_producers": super()._get_announced_producers,
+            "announced_users": super()._get_announced_users,
+            "pubqueue": super()._get_pubqueue,
+        }
+        resps = self._gather(*(partial(i, group_id) for i in getters.values()))
+        return dict(zip(getters, resps))
+
     def create_group(
         self,
         group_name: str,
@@ -245,6 +423,15 @@ class FullNodeAPI(BaseAPI):
         group_id = self._check_group_joined_as_required(group_id)
         return super()._post_content(group_id, {"data": data})
 
+    def post_contents(self, datas: list, group_id: str = None) -> list:
+        """post trxs to group concurrently, return the resps in order"""
+        group_id = self._check_group_joined_as_required(group_id)
+        # bound here, zero-argument super() does not work in a genexpr
+        post = super()._post_content
+        return self._gather(
+            *(partial(post, group_id, {"data": data}) for data in datas)
+        )
+
     def get_content(
         self,
         start_trx: str = None,
@@ -254,6 +441,28 @@ class FullNodeAPI(BaseAPI):
         include_start_trx: bool = False,
         senders: list = None,
     ) -> list:
+        return list(
+            self.iter_content(
+                start_trx,
+                group_id,
+                num=num,
+                reverse=reverse,
+                include_start_trx=include_start_trx,
+                senders=senders,
+            )
+        )
+
+    def iter_content(
+        self,
+        start_trx: str = None,
+        group_id: str = None,
+        *,
+        num: int = 20,
+        reverse: bool = False,
+        include_start_trx: bool = False,
+        senders: list = None,
+    ):
+        """like get_content, but decode the Data of trxs lazily one by one"""
         group_id = self._check_group_id_as_required(group_id)
         params = {
             "num": num,
@@ -264,15 +473,14 @@ class FullNodeAPI(BaseAPI):
             params["include_start_trx"] = include_start_trx
         if senders:
             params["senders"] = senders
-        trxs = []
-        for trx in super()._get_content(group_id, params):
-            # private group will return trx without Data
-            try:
-                trx["Data"] = json.loads(base64.b64decode(trx["Data"]))
-            except Exception as err:
-                logger.warning(f"decode trx data error: {err}\n{trx}")
-            trxs.append(trx)
-        return trxs
+        trxs = super()._get_content(group_id, params)
+        # an error response is a dict, not the trx list
+        if not isinstance(trxs, list):
+            errmsg = trxs.get("error", trxs) if isinstance(trxs, dict) else trxs
+            raise RumChainException(
+                f"get content failed: {errmsg}", response=trxs
+            )
+        return _decode_trxs(trxs)
 
     def trx(self, trx_id: str, group_id: str = None):
         """get trx data by trx_id"""
@@ -280,12 +488,20 @@ class FullNodeAPI(BaseAPI):
         if not trx_id:
             return trx
 
-        trxs = self.get_content(
-            start_trx=trx_id, num=1, include_start_trx=True, group_id=group_id
-        )
-        if trxs:
-            trx = trxs[0]
-        else:
+        try:
+            trx = next(
+                self.iter_content(
+                    start_trx=trx_id,
+                    num=1,
+                    include_start_trx=True,
+                    group_id=group_id,
+                ),
+                None,
+            )
+        except RumChainException as err:
+            logger.warning("get content error: %s", err)
+            trx = None
+        if trx is None:
             trx = self.get_trx(trx_id, group_id)
         return trx
 
@@ -311,18 +527,21 @@ class FullNodeAPI(BaseAPI):
 
     def ack(self, trx_ids: list):
         """ack the trxs"""
-        if trx_ids == []:
+        if not trx_ids:
             return True
         return super()._pubqueue_ack({"trx_ids": trx_ids})
 
     def autoack(self, group_id: str = None):
         """auto ack the  Fail trxs"""
         group_id = self._check_group_id_as_required(group_id)
-        tids = [
-            i["Trx"]["TrxId"]
-            for i in self.pubqueue(group_id)
-            if i["State"] == "FAIL"
-        ]
+        queue = self.pubqueue(group_id)
+        # the node may send a null Data for an empty queue
+        if not queue:
+            return True
+        # an error response is a dict, not the queue list
+        if not isinstance(queue, list):
+            return queue
+        tids = [i["Trx"]["TrxId"] for i in queue if i.get("State") == "FAIL"]
         return self.ack(tids)
 
     def get_keylist(self, group_id: str = None):
@@ -344,12 +563,10 @@ class FullNodeAPI(BaseAPI):
         memo: str = None,
         group_id: str = None,
     ):
+        action = _check_action(action)
         group_id = self._check_group_owner_as_required(group_id)
-
-        if action.lower() not in ["add", "remove"]:
-            raise ParamValueError("action must be add or remove")
         payload = {
-            "action": action.lower() or "add",
+            "action": action,
             "group_id": group_id,
             "name": name,
             "type": _type,
@@ -367,13 +584,13 @@ class FullNodeAPI(BaseAPI):
         trx_type = _check_trx_type(trx_type)
         return super()._get_trx_auth(group_id, trx_type)
 
-    def get_auth(self):
+    def get_auth(self, group_id: str = None) -> dict:
         """get the trx mode of all the trx types"""
-        rlt = {}
-        for itype in TRX_TYPES:
-            resp = self.get_trx_auth(itype)
-            rlt[resp["TrxType"]] = resp["AuthType"]
-        return rlt
+        group_id = self._check_group_id_as_required(group_id)
+        resps = self._gather(
+            *(partial(self.get_trx_auth, i, group_id) for i in TRX_TYPES)
+        )
+        return {resp["TrxType"]: resp["AuthType"] for resp in resps}
 
     def set_trx_auth(
         self,
@@ -389,17 +606,13 @@ class FullNodeAPI(BaseAPI):
             alw "follow_alw_list"
             dny "follow_dny_list"
         """
-        group_id = self._check_group_owner_as_required(group_id)
         mode = _check_trx_mode(mode)
         trx_type = _check_trx_type(trx_type)
-        payload = {
-            "group_id": group_id,
-            "type": "set_trx_auth_mode",
-            "config": json.dumps(
-                {"trx_type": trx_type, "trx_auth_mode": f"follow_{mode}_list"}
-            ),
-            "Memo": memo,
-        }
+        group_id = self._check_group_owner_as_required(group_id)
+        config = {"trx_type": trx_type, "trx_auth_mode": f"follow_{mode}_list"}
+        payload = _chainconfig_payload(
+            group_id, "set_trx_auth_mode", config, memo
+        )
         return super()._post_chainconfig(payload)
 
     def get_allow_list(self, group_id: str = None):
@@ -422,19 +635,15 @@ class FullNodeAPI(BaseAPI):
         group_id: str = None,
     ):
         """update the list for the trx mode"""
-        group_id = self._check_group_owner_as_required(group_id)
+        # validate the args before any request to the node
         mode = _check_trx_mode(mode)
-        trx_types = trx_types or ["post"]
-        trx_types = [_check_trx_type(trx_type) for trx_type in trx_types]
-        if action not in ["add", "remove"]:
-            raise ParamValueError("action must be add or remove")
+        trx_types = sorted({_check_trx_type(i) for i in trx_types or ["post"]})
+        action = _check_action(action)
+        group_id = self._check_group_owner_as_required(group_id)
         _params = {"action": action, "pubkey": pubkey, "trx_type": trx_types}
-        payload = {
-            "group_id": group_id,
-            "type": f"upd_{mode}_list",
-            "config": json.dumps(_params),
-            "Memo": memo,
-        }
+        payload = _chainconfig_payload(
+            group_id, f"upd_{mode}_list", _params, memo
+        )
         return super()._post_chainconfig(payload)
 
     def add_allow_list(
@@ -491,8 +700,7 @@ class FullNodeAPI(BaseAPI):
 
     def producers(self, group_id: str = None):
         """get the producers pubkey list of the group"""
-        bps = self.get_consensus(group_id).get("producers", [])
-        return [bp["ProducerPubkey"] for bp in bps]
+        return _producers_from(self.get_consensus(group_id))
 
     def get_announced_producers(self, group_id: str = None):
         """get the announced producers to be approved"""
@@ -500,46 +708,68 @@ class FullNodeAPI(BaseAPI):
         return super()._get_announced_producers(group_id)
 
     def add_producer(self, pubkeys: list, group_id: str = None):
-        """add pubkey as group producer to the group"""
-        payload = {
-            "producer_pubkey": pubkeys,
-            "group_id": group_id,
-            "action": "add",
-        }
-        return super()._update_consensus(payload)
+        """add pubkeys as group producers to the group
+        pubkeys: list of pubkeys, all sent in one request
+        """
+        return self._update_producers(pubkeys, "add", group_id)
 
     def remove_producer(self, pubkeys: list, group_id: str = None):
-        """remove pubkey as group producer from the group"""
+        """remove pubkeys as group producers from the group
+        pubkeys: list of pubkeys, all sent in one request
+        """
+        return self._update_producers(pubkeys, "remove", group_id)
+
+    def add_producers_batch(
+        self, pubkeys, group_id: str = None, batch_size: int = 64
+    ) -> list:
+        """add many pubkeys as group producers, batch_size per request"""
+        return self._update_producers_batch(
+            pubkeys, "add", group_id, batch_size
+        )
+
+    def remove_producers_batch(
+        self, pubkeys, group_id: str = None, batch_size: int = 64
+    ) -> list:
+        """remove many pubkeys as group producers, batch_size per request"""
+        return self._update_producers_batch(
+            pubkeys, "remove", group_id, batch_size
+        )
+
+    def _update_producers(self, pubkeys: list, action: str, group_id: str):
+        if isinstance(pubkeys, str):
+            pubkeys = [pubkeys]
         payload = {
-            "producer_pubkey": pubkeys,
+            "producer_pubkey": list(dict.fromkeys(pubkeys)),
             "group_id": group_id,
-            "action": "remove",
+            "action": action,
         }
         return super()._update_consensus(payload)
 
+    def _update_producers_batch(
+        self, pubkeys, action: str, group_id: str, batch_size: int
+    ) -> list:
+        if batch_size < 1:
+            raise ParamValueError("batch_size should be greater than 0")
+        if isinstance(pubkeys, str):
+            pubkeys = [pubkeys]
+        # dedupe across the batches, not only within each
+        pubkeys = list(dict.fromkeys(pubkeys))
+        return [
+            self._update_producers(
+                pubkeys[i : i + batch_size], action, group_id
+            )
+            for i in range(0, len(pubkeys), batch_size)
+        ]
+
     def announce_as_producer(self, group_id: str = None, memo: str = None):
         """announce fullnode self as producer"""
-        group_id = self._check_group_id_as_required(group_id)
-        payload = {
-            "group_id": group_id,
-            "action": "add",
-            "type": "producer",
-            "memo": memo or "announce self as producer",
-        }
-        return super()._announce(payload)
+        return self._announce_as("producer", "add", memo, group_id)
 
     def announce_as_producer_to_remove(
         self, group_id: str = None, memo: str = None
     ):
         """announce fullnode self as producer to remove"""
-        group_id = self._check_group_id_as_required(group_id)
-        payload = {
-            "group_id": group_id,
-            "action": "remove",
-            "type": "producer",
-            "memo": memo or "announce self as producer to remove",
-        }
-        return super()._announce(payload)
+        return self._announce_as("producer", "remove", memo, group_id)
 
     def get_consensus(self, group_id: str = None):
         group_id = self._check_group_id_as_required(group_id)
@@ -571,13 +801,6 @@ class FullNodeAPI(BaseAPI):
         group_id: str = None,
     ):
         group_id = self._check_group_id_as_required(group_id)
-        req_id = self.get_consensus(group_id).get("proof_req_id")
-        reqs = self.get_consensus_req(req_id, group_id).get("resps", [])
-        if not reqs:
-            req = {}
-        else:
-            req = reqs[0]["Req"]
-
         if start_from_epoch is None:
             start_from_epoch = 1
         if trx_epoch_tick and trx_epoch_tick < 500:
@@ -589,28 +812,22 @@ class FullNodeAPI(BaseAPI):
         if agreement_tick_count and agreement_tick_count < 10:
             raise ValueError("agreement_tick_count should be greater than 10")
 
-        _exist = {
-            "group_id": group_id,
-            "start_from_epoch": req.get("StartFromEpoch") or 1,
-            "trx_epoch_tick": req.get("TrxEpochTickLenInMs") or 500,
-            "agreement_tick_Length": req.get("AgreementTickLenInMs") or 1000,
-            "agreement_tick_count": req.get("AgreementTickCount") or 10,
-            "producer_pubkey": req.get("ProducerPubkeyList") or [],
-        }
-
-        payload = {
-            "group_id": group_id,
-            "start_from_epoch": start_from_epoch or _exist["start_from_epoch"],
-            "trx_epoch_tick": trx_epoch_tick or _exist["trx_epoch_tick"],
-            "agreement_tick_Length": agreement_tick_length
-            or _exist["agreement_tick_Length"],
-            "agreement_tick_count": agreement_tick_count
-            or _exist["agreement_tick_count"],
-            "producer_pubkey": producer_pubkey or _exist["producer_pubkey"],
-        }
-
-        if payload == _exist:
+        # the proof request depends on the consensus, so fetched in turn
+        req_id = self.get_consensus(group_id).get("proof_req_id")
+        reqs = self.get_consensus_req(req_id, group_id).get("resps", [])
+        req = reqs[0]["Req"] if reqs else {}
+
+        values = (
+            start_from_epoch,
+            trx_epoch_tick,
+            agreement_tick_length,
+            agreement_tick_count,
+            producer_pubkey,
+        )
+        payload = _merge_consensus(req, values)
+        if payload is None:
             return {"message": "Nothing to update"}
+        payload["group_id"] = group_id
 
         if payload["trx_epoch_tick"] < payload["agreement_tick_Length"]:
             logger.warning(
@@ -635,12 +852,15 @@ class FullNodeAPI(BaseAPI):
 
     def announce_as_user(self, memo: str = None, group_id: str = None):
         """announce as user"""
+        return self._announce_as("user", "add", memo, group_id)
+
+    def _announce_as(self, _type: str, action: str, memo: str, group_id: str):
         group_id = self._check_group_id_as_required(group_id)
         payload = {
             "group_id": group_id,
-            "action": "add",
-            "type": "user",
-            "memo": memo or "announce self as user",
+            "action": action,
+            "type": _type,
+            "memo": memo or _ANNOUNCE_MEMOS[(_type, action)],
         }
         return super()._announce(payload)
 
@@ -648,26 +868,57 @@ class FullNodeAPI(BaseAPI):
         """update the user of the group
         action: "add" or "remove"
         """
+        action = _check_action(action)
         group_id = self._check_group_owner_as_required(group_id)
-        if action.lower() not in ["add", "remove"]:
-            raise ParamValueError("action must be one of these: add, remove")
         payload = {
             "user_pubkey": pubkey,
             "group_id": group_id,
-            "action": action.lower(),
+            "action": action,
         }
         return super()._post_user(payload)
 
-    def add_user(self, pubkey: str, group_id: str = None):
-        """add pubkey as group user to the group"""
-        try:
-            status = self.get_announced_user(pubkey)
-            if status.get("Result") == "APPROVED":
-                return status
-        except Exception as err:
-            logger.debug(err)
+    def add_user(
+        self, pubkey: str, group_id: str = None, skip_check: bool = False
+    ):
+        """add pubkey as group user to the group
+        skip_check: approve without checking the announced user status
+        """
+        group_id = self._check_group_id_as_required(group_id)
+        key = f"{group_id}/{pubkey}"
+        status = self._approved_users.get(key)
+        if status is not None:
+            return status
+        if not skip_check:
+            try:
+                status = self.get_announced_user(pubkey, group_id)
+                if status.get("Result") == "APPROVED":
+                    self._approved_users.set(key, status)
+                    return status
+            except Exception as err:
+                logger.debug("check announced user %s error: %s", pubkey, err)
         return self._approve_user(pubkey, "add", group_id)
 
     def remove_user(self, pubkey: str, group_id: str = None):
         """remove pubkey as group user from the group"""
+        group_id = self._check_group_id_as_required(group_id)
+        self._approved_users.delete(f"{group_id}/{pubkey}")
         return self._approve_user(pubkey, "remove", group_id)
+
+    def add_users(
+        self, pubkeys: list, group_id: str = None, skip_check: bool = False
+    ) -> list:
+        """add pubkeys as group users to the group concurrently"""
+        group_id = self._check_group_owner_as_required(group_id)
+        return self._gather(
+            *(
+                partial(self.add_user, pubkey, group_id, skip_check)
+                for pubkey in pubkeys
+            )
+        )
+
+    def remove_users(self, pubkeys: list, group_id: str = None) -> list:
+        """remove pubkeys as group users from the group concurrently"""
+        group_id = self._check_group_owner_as_required(group_id)
+        return self._gather(
+            *(partial(self.remove_user, pubkey, group_id) for pubkey in pubkeys)
+        )
@@ -1,7 +1,16 @@
+import gzip
 import logging
 import os
+import threading
+from concurrent.futures import Future
+from copy import deepcopy
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from quorum_fullnode_py._json import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -9,40 +18,141 @@ logger = logging.getLogger(__name__)
 class HttpRequest:
     """Class for making http requests"""
 
+    __slots__ = (
+        "api_base",
+        "timeout",
+        "gzip_threshold",
+        "session",
+        "_write_slots",
+        "_inflight",
+        "_inflight_lock",
+    )
+
     def __init__(
         self,
         api_base: str,
         jwt_token: str = None,
+        *,
+        max_write_concurrency: int = 8,
+        timeout: float = None,
+        pool_maxsize: int = 64,
+        max_retries: int = 3,
+        gzip_threshold: int = None,
     ):
-        """Initializes the HttpRequest class"""
-        requests.adapters.DEFAULT_RETRIES = 5
-        self.api_base = api_base
+        """Initializes the HttpRequest class
+        timeout: seconds to wait for the node, None to wait forever
+        pool_maxsize: keep-alive connections kept per host
+        max_retries: retries with backoff of idempotent requests
+            on connection errors and 502/503/504
+        gzip_threshold: gzip request bodies larger than this many bytes,
+            None to never compress; the node must accept gzip bodies"""
+        # endpoints start with "/", so keep a single slash between
+        self.api_base = api_base.rstrip("/")
+        self.timeout = timeout
+        self.gzip_threshold = gzip_threshold
         self.session = requests.Session()
-        headers = {"Content-Type": "application/json"}
+        headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
         if jwt_token:
             headers.update({"Authorization": f"Bearer {jwt_token}"})
         self.session.headers.update(headers)
 
-        _no_proxy = os.getenv("NO_PROXY", "")
-        if self.api_base not in _no_proxy:
-            os.environ["NO_PROXY"] = ",".join([_no_proxy, self.api_base])
+        # reuse pooled keep-alive connections across all api calls
+        # posts are not idempotent, so Retry leaves them alone by default
+        # the last error response is still returned, as the node's json body
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retries
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # back-pressure for bulk writes from many threads
+        self._write_slots = threading.BoundedSemaphore(max_write_concurrency)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
 
-    def _request(
+        # NO_PROXY entries are hosts, not urls
+        host = urlparse(self.api_base).hostname or self.api_base
+        _no_proxy = [i for i in os.getenv("NO_PROXY", "").split(",") if i]
+        if host not in _no_proxy:
+            os.environ["NO_PROXY"] = ",".join(_no_proxy + [host])
+
+    def _send(
         self,
         method: str,
         endpoint: str,
         payload: dict = None,
+        headers: dict = None,
     ):
-        url = "".join([self.api_base, endpoint])
-        resp = self.session.request(method=method, url=url, json=payload)
+        url = self.api_base + endpoint
+        # payload may be pre-serialized json bytes
+        if payload is None or isinstance(payload, bytes):
+            data = payload
+        else:
+            data = dumps(payload)
+        if (
+            data is not None
+            and self.gzip_threshold is not None
+            and len(data) > self.gzip_threshold
+        ):
+            data = gzip.compress(data)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        resp = self.session.request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            timeout=self.timeout,
+        )
         logger.debug("Payload %s", payload)
-        return resp.json()
+        return resp
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        payload: dict = None,
+    ):
+        resp = self._send(method, endpoint, payload)
+        return loads(resp.content)
 
     def get(self, endpoint: str, payload: dict = None):
-        return self._request("get", endpoint, payload)
+        if payload is not None:
+            return self._request("get", endpoint, payload)
+        # single flight: concurrent identical gets share one request
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[endpoint] = future
+        if not is_leader:
+            # the leader and the other waiters hold the same response
+            return deepcopy(future.result())
+        try:
+            data = self._request("get", endpoint)
+        except BaseException as err:
+            # also on KeyboardInterrupt, or the waiters block forever
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(endpoint, None)
+        return data
 
     def post(self, endpoint: str, payload: dict = None):
-        return self._request("post", endpoint, payload)
+        with self._write_slots:
+            return self._request("post", endpoint, payload)
 
     def delete(self, endpoint: str, payload: dict = None):
-        return self._request("delete", endpoint, payload)
+        with self._write_slots:
+            return self._request("delete", endpoint, payload)
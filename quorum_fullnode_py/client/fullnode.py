@@ -1,5 +1,6 @@
 import logging
 
+from quorum_fullnode_py.api.base import CACHE_TTL
 from quorum_fullnode_py.api.fullnode import FullNodeAPI
 from quorum_fullnode_py.client._http import HttpRequest
 from quorum_fullnode_py.exceptions import ParamValueError
@@ -8,21 +9,41 @@ logger = logging.getLogger(__name__)
 
 
 class FullNode:
-    _group_id = None
+    __slots__ = ("_group_id", "api")
 
     def __init__(
         self,
         api_base: str = None,
         jwt_token: str = None,
         port: int = None,
+        *,
+        cache_ttl: float = CACHE_TTL,
+        timeout: float = None,
+        max_write_concurrency: int = 8,
+        pool_maxsize: int = 64,
+        max_retries: int = 3,
+        gzip_threshold: int = None,
     ):
+        """connect to a quorum fullnode
+        cache_ttl: seconds to cache GET responses, 0 to disable
+        the other keyword-only options tune the http client, see HttpRequest
+        """
         if port:
             api_base = f"http://127.0.0.1:{port}"
         if not api_base:
             raise ParamValueError("api_base is required")
 
-        http = HttpRequest(api_base, jwt_token)
-        self.api = FullNodeAPI(http, self.group_id)
+        self._group_id = None
+        http = HttpRequest(
+            api_base,
+            jwt_token,
+            max_write_concurrency=max_write_concurrency,
+            timeout=timeout,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            gzip_threshold=gzip_threshold,
+        )
+        self.api = FullNodeAPI(http, self.group_id, cache_ttl)
 
     @property
     def group_id(self):
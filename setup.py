@@ -32,4 +32,8 @@ setuptools.setup(
     install_requires=[
         "requests",
     ],
+    extras_require={
+        "orjson": ["orjson"],
+        "brotli": ["brotli"],
+    },
 )
@@ -0,0 +1,147 @@
+import asyncio
+import json
+from urllib.parse import urlencode
+
+from quorum_fullnode_py.api import AsyncFullNodeAPI
+from quorum_fullnode_py.api.base import BaseAPI, _build_content_qs
+from quorum_fullnode_py.api.fullnode import (
+    TRX_TYPES,
+    FullNodeAPI,
+    _merge_consensus,
+)
+
+GROUP_ID = "test-group"
+
+
+class StubHttp:
+    """record the requests and answer from a dict of endpoint to response"""
+
+    def __init__(self, responses: dict = None):
+        self.responses = responses or {}
+        self.calls = []
+
+    def _answer(self, method, endpoint, payload):
+        self.calls.append((method, endpoint, payload))
+        resp = self.responses.get(endpoint, {})
+        return resp(endpoint, payload) if callable(resp) else resp
+
+    def get(self, endpoint, payload=None):
+        return self._answer("get", endpoint, payload)
+
+    def post(self, endpoint, payload=None):
+        return self._answer("post", endpoint, payload)
+
+    def delete(self, endpoint, payload=None):
+        return self._answer("delete", endpoint, payload)
+
+
+def test_cache_is_off_by_default():
+    http = StubHttp({"/api/v1/node": {"node_status": "NODE_ONLINE"}})
+    api = BaseAPI(http, GROUP_ID)
+    api._get_node()
+    api._get_node()
+    assert len(http.calls) == 2
+
+
+def test_post_invalidates_cache():
+    http = StubHttp({"/api/v1/node": {"node_status": "NODE_ONLINE"}})
+    api = BaseAPI(http, GROUP_ID, cache_ttl=60)
+    api._get_node()
+    api._get_node()
+    assert len(http.calls) == 1
+    api._post("/api/v1/group", {})
+    api._get_node()
+    assert [i[0] for i in http.calls] == ["get", "post", "get"]
+
+
+def test_cached_response_is_copied():
+    http = StubHttp({"/api/v1/network": {"groups": [{"GroupId": "a"}]}})
+    api = BaseAPI(http, GROUP_ID, cache_ttl=60)
+    api._get_network()["groups"].append({"GroupId": "b"})
+    assert api._get_network() == {"groups": [{"GroupId": "a"}]}
+    assert len(http.calls) == 1
+
+
+def test_block_cached_only_with_block_id():
+    http = StubHttp(
+        {
+            f"/api/v1/block/{GROUP_ID}/a": {"BlockId": "a"},
+            f"/api/v1/block/{GROUP_ID}/b": {},
+        }
+    )
+    api = BaseAPI(http, GROUP_ID, cache_ttl=60)
+    for block_id in ("a", "a", "b", "b"):
+        api._get_block(GROUP_ID, block_id)
+    assert len(http.calls) == 3
+
+
+def test_content_qs_matches_urlencode():
+    params = {
+        "num": 20,
+        "reverse": False,
+        "start_trx": "a b/c",
+        "include_start_trx": True,
+        "senders": ["x+y", "z=1"],
+    }
+    expected = {
+        k: json.dumps(v) if isinstance(v, bool) else v
+        for k, v in params.items()
+    }
+    assert _build_content_qs(params) == urlencode(expected, doseq=True)
+
+
+def test_merge_consensus():
+    req = {"StartFromEpoch": 3, "TrxEpochTickLenInMs": 800}
+    assert _merge_consensus(req, (3, None, None, None, None)) is None
+    payload = _merge_consensus(req, (3, 900, None, None, None))
+    assert payload == {
+        "start_from_epoch": 3,
+        "trx_epoch_tick": 900,
+        "agreement_tick_Length": 1000,
+        "agreement_tick_count": 10,
+        "producer_pubkey": [],
+    }
+
+
+def test_producers_batch():
+    http = StubHttp()
+    api = FullNodeAPI(http, GROUP_ID)
+    pubkeys = ["a", "b", "a", "c", "d", "e"]
+    api.add_producers_batch(pubkeys, GROUP_ID, batch_size=2)
+    sent = [i[2]["producer_pubkey"] for i in http.calls]
+    assert sent == [["a", "b"], ["c", "d"], ["e"]]
+    assert all(i[2]["action"] == "add" for i in http.calls)
+
+
+def test_get_auth():
+    def trx_auth(endpoint, payload):
+        trx_type = endpoint.rsplit("/", 1)[1]
+        return {"TrxType": trx_type, "AuthType": "FOLLOW_DNY_LIST"}
+
+    http = StubHttp(
+        {f"/api/v1/group/{GROUP_ID}/trx/auth/{i}": trx_auth for i in TRX_TYPES}
+    )
+    api = FullNodeAPI(http, GROUP_ID)
+    assert api.get_auth() == {i: "FOLLOW_DNY_LIST" for i in TRX_TYPES}
+    assert len(http.calls) == len(TRX_TYPES)
+
+
+def test_async_api():
+    http = StubHttp(
+        {
+            "/api/v1/node": {"node_status": "NODE_ONLINE"},
+            "/api/v1/groups": {"groups": [{"group_id": GROUP_ID}]},
+        }
+    )
+    async_api = AsyncFullNodeAPI(FullNodeAPI(http, GROUP_ID))
+
+    async def main():
+        info, groups_id = await asyncio.gather(
+            async_api.node_info(), async_api.groups_id
+        )
+        return info, groups_id
+
+    info, groups_id = asyncio.run(main())
+    assert info["node_status"] == "NODE_ONLINE"
+    assert groups_id == [GROUP_ID]
+    assert async_api.group_id == GROUP_ID
@@ -46,6 +46,15 @@ def test_create_group():
     assert ginfo["group_id"] == group_id
 
 
+def test_snapshot():
+    group_id = bot.group_id
+
+    snap = bot.api.snapshot(group_id)
+    assert snap["group"]["group_id"] == group_id
+    assert "consensus" in snap
+    assert "pubqueue" in snap
+
+
 @pytest.mark.run(order=1)
 def test_post_content():
 
@@ -58,16 +67,19 @@ def test_post_content():
         assert "group_id" in info
 
     group_id = bot.api.groups_id[0]
+    assert group_id in bot.api.groups_id_set
     bot.group_id = group_id
 
     # post content with empty data
 
     resps = []
+    posted = []
 
     data = feed.new_post(content="hello world", images=[])
     resp = bot.api.post_content(data)
     assert "trx_id" in resp
     resps.append(resp)
+    posted.append(data)
 
     data = feed.new_post(
         content="hello world", images=[], post_id="test_postid"
@@ -75,11 +87,13 @@ def test_post_content():
     resp = bot.api.post_content(data)
     assert "trx_id" in resp
     resps.append(resp)
+    posted.append(data)
 
     data = feed.new_post(content="hello world", images=[], name="test_postid")
     resp = bot.api.post_content(data)
     assert "trx_id" in resp
     resps.append(resp)
+    posted.append(data)
 
     try:
         data = feed.new_post(content=None, images=[], name="test_postid")
@@ -100,6 +114,19 @@ def test_post_content():
     trxs = bot.api.get_content()
     assert len(trxs) >= 0
 
+    trx_id = resps[0]["trx_id"]
+    trx = next(
+        bot.api.iter_content(trx_id, include_start_trx=True, num=1), None
+    )
+    assert trx["TrxId"] == trx_id
+    assert trx["Data"] == posted[0]
+
+    datas = [feed.new_post(content=f"hello {i}", images=[]) for i in range(5)]
+    resps = bot.api.post_contents(datas)
+    assert len(resps) == len(datas)
+    for resp in resps:
+        assert "trx_id" in resp
+
 
 @pytest.mark.run(order=-2)
 def test_clear_group():
@@ -0,0 +1,83 @@
+import gzip
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from quorum_fullnode_py._json import dumps
+from quorum_fullnode_py.client._http import HttpRequest
+
+ENDPOINT = "/api/v1/node"
+
+
+def _get_in_threads(http: HttpRequest, num: int) -> list:
+    """call http.get from num threads, return the results or errors"""
+    results = [None] * num
+
+    def call(i):
+        try:
+            results[i] = http.get(ENDPOINT)
+        except Exception as err:
+            results[i] = err
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(num)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_get_single_flight():
+    calls = []
+
+    def slow_request(self, method, endpoint, payload=None):
+        calls.append(endpoint)
+        time.sleep(0.2)
+        return {"node_status": "NODE_ONLINE"}
+
+    http = HttpRequest("http://127.0.0.1:1")
+    with mock.patch.object(HttpRequest, "_request", slow_request):
+        results = _get_in_threads(http, 8)
+    assert len(calls) == 1
+    assert all(i == {"node_status": "NODE_ONLINE"} for i in results)
+    # each waiter gets its own copy
+    assert len({id(i) for i in results}) == len(results)
+    assert not http._inflight
+
+
+def test_get_single_flight_error():
+    calls = []
+
+    def failed_request(self, method, endpoint, payload=None):
+        calls.append(endpoint)
+        time.sleep(0.2)
+        raise requests.ConnectionError("node is down")
+
+    http = HttpRequest("http://127.0.0.1:1")
+    with mock.patch.object(HttpRequest, "_request", failed_request):
+        results = _get_in_threads(http, 8)
+        assert len(calls) == 1
+        assert all(isinstance(i, requests.ConnectionError) for i in results)
+        assert not http._inflight
+        # the failure is not remembered, the next get is sent again
+        with pytest.raises(requests.ConnectionError):
+            http.get(ENDPOINT)
+        assert len(calls) == 2
+
+
+def test_gzip_threshold():
+    http = HttpRequest("http://127.0.0.1:1", gzip_threshold=100)
+    resp = mock.Mock(content=b"{}")
+    with mock.patch.object(
+        requests.Session, "request", return_value=resp
+    ) as req:
+        http.post("/api/v1/group", {"data": "x" * 10})
+        assert req.call_args[1]["headers"] is None
+        payload = {"data": "x" * 200}
+        http.post("/api/v1/group", payload)
+        kwargs = req.call_args[1]
+    assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+    assert gzip.decompress(kwargs["data"]) == dumps(payload)